@@ -3,13 +3,15 @@
 yt-dlp Python launcher
 - GUI app to paste URLs, choose output format/dir, and track status
 - auto-downloads yt-dlp.exe and ffmpeg if missing (bin/)
-- runs several yt-dlp processes in parallel (one process per URL)
+- runs several yt-dlp processes in parallel (GUI: one per URL; CLI: URLs split across MAX_WORKERS processes)
 - streams output to GUI and writes logs (logs/)
 - converts best audio -> selected format, embeds metadata & cover
 """
 
-import base64
+import codecs
 import datetime as dt
+import hashlib
+import io
 import os
 import sys
 import shutil
@@ -18,6 +20,7 @@ import subprocess
 import tempfile
 import threading
 import time
+import urllib.error
 import urllib.request
 import zipfile
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -28,7 +31,7 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from tkinter.scrolledtext import ScrolledText
 
-from icon_data import ICO_BASE64, PNG_BASE64
+from icon_data import ICO_BYTES, PNG_BASE64
 
 # ---------------- CONFIG ----------------
 BASE = Path(__file__).resolve().parent
@@ -59,14 +62,25 @@ MAX_WORKERS = 4
 PARALLEL_FRAGMENTS = "16"
 CONCURRENT_FRAGMENTS = "16"
 
+# yt-dlp output encoding (forced with --encoding so the bytes can go straight to the UTF-8 log)
+OUTPUT_ENCODING = "utf-8"
+PIPE_BUFFER_SIZE = 1 << 16  # yt-dlp stdout buffer and max bytes handled per batch
+# no console window per yt-dlp.exe on Windows
+CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform.startswith("win") else 0
+
 # audio options
 AUDIO_QUALITY = "0"  # best VBR
 
 # download sources
 YTDLP_RELEASE_URL = "https://github.com/yt-dlp/yt-dlp/releases/latest/download/yt-dlp.exe"
+YTDLP_SUMS_URL = "https://github.com/yt-dlp/yt-dlp/releases/latest/download/SHA2-256SUMS"
 FFMPEG_ZIP_URL = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
 FFMPEG_VERSION_FILE = BIN / "ffmpeg.version"
+YT_DLP_CHECK_STAMP = BIN / "yt-dlp.stamp"
+FFMPEG_CHECK_STAMP = BIN / "ffmpeg.stamp"
+UPDATE_CHECK_INTERVAL = 24 * 60 * 60  # seconds between yt-dlp/ffmpeg update checks
 ICON_URL = "https://avatars.githubusercontent.com/u/79589310?v=4"
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB per read/write while streaming downloads
 
 OUTPUT_FORMATS = [
     {"name": "MP3 320k", "format": "mp3", "bitrate": "320K", "video_only": False, "output_ext": "mp3"},
@@ -83,22 +97,146 @@ OUTPUT_FORMATS = [
     {"name": "WEBM Video", "format": "webm", "bitrate": None, "video_only": True, "output_ext": "webm"},
 ]
 PLAYLIST_MODES = {"single": "Single file", "playlist": "Playlist (all items)"}
-LOG_LOCK = threading.Lock()
 # ----------------------------------------
 
+YT_DLP_LOCK = threading.Lock()
+CONSOLE_LOCK = threading.Lock()
+FFMPEG_LOCK = threading.Lock()
+
+# (path, text) entries for LOG_FILE/ERR_LOG_FILE; a single writer thread owns both handles
+LOG_QUEUE = Queue()
+LOG_WRITER = None
+
+def stat_or_none(path: Path):
+    """One stat() call in place of exists() followed by stat()/read."""
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
 def ensure_dirs():
     for d in (BIN, OUT, LOGS, ICON_CACHE_DIR):
         d.mkdir(parents=True, exist_ok=True)
-    # ensure logs exist
-    LOG_FILE.touch(exist_ok=True)
-    ERR_LOG_FILE.touch(exist_ok=True)
+    # ensure logs exist (touch only when missing, it would rewrite the mtime)
+    for f in (LOG_FILE, ERR_LOG_FILE):
+        if stat_or_none(f) is None:
+            f.touch()
+    start_log_writer()
 
-def download_file(url: str, dest: Path):
-    print(f"Downloading {url} -> {dest.name} ...")
+class EventBuffer:
+    """
+    Double-buffered event list shared by worker threads and the GUI.
+    Workers append under a short lock; the GUI swaps the two lists and
+    processes the filled one without holding the lock. `notify` is called
+    for the first event after a drain, i.e. once per batch to drain; if it
+    returns False (the wake-up could not be delivered) the next put retries.
+    At most `maxsize` events are held; beyond that "log" events are dropped
+    (they are still in LOG_FILE) while status/done events are always kept.
+    """
+
+    def __init__(self, notify=None, maxsize: int = 65536):
+        self._lock = threading.Lock()
+        self._active = []
+        self._spare = []
+        self._notify = notify
+        self._maxsize = maxsize
+        self._dropped = 0
+        self._armed = True  # next put should notify
+
+    def put(self, payload: dict):
+        with self._lock:
+            if len(self._active) >= self._maxsize and payload.get("type") == "log":
+                self._dropped += 1
+                return
+            self._active.append(payload)
+            notify, self._armed = self._armed, False
+        if notify and self._notify is not None and self._notify() is False:
+            with self._lock:
+                self._armed = True
+
+    def drain(self) -> list:
+        """Returns all pending events; the list is only valid until the next drain()."""
+        self._spare.clear()
+        with self._lock:
+            self._active, self._spare = self._spare, self._active
+            dropped, self._dropped = self._dropped, 0
+            self._armed = True
+        if dropped:
+            self._spare.append({"type": "log", "text": f"... {dropped} log lines skipped, see {LOG_FILE}"})
+        return self._spare
+
+def download_progress(label: str, event_queue: EventBuffer | None = None, step: int = 10):
+    """
+    Returns a progress callback for download_file that reports every `step` percent
+    to the console and, when given, to the GUI event queue.
+    """
+    last_reported = -step
+
+    def report(done: int, total: int):
+        nonlocal last_reported
+        if not total:
+            return
+        percent = done * 100 // total
+        if percent - last_reported < step and done < total:
+            return
+        last_reported = percent
+        text = f"{label}: {percent}% ({done / 1e6:.1f}/{total / 1e6:.1f} MB)"
+        print(text)
+        queue_event(event_queue, {"type": "log", "text": text})
+
+    return report
+
+def copy_response(response, handle, progress=None):
+    """Streams an HTTP response body into handle in DOWNLOAD_CHUNK_SIZE pieces."""
+    total = int(response.headers.get("Content-Length") or 0)
+    done = 0
+    while True:
+        chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        handle.write(chunk)
+        done += len(chunk)
+        if progress:
+            progress(done, total)
+
+def open_url(url: str, headers: dict | None = None):
+    """
+    Opens url for reading. Returns None when the server answers 304 Not Modified
+    to a conditional request.
+    """
+    request = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0", **(headers or {})})
+    try:
+        return urllib.request.urlopen(request)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None
+        raise
+
+def download_bytes(url: str) -> bytes:
+    """Fetches a small resource straight into memory."""
+    with open_url(url) as response:
+        return response.read()
+
+def download_file(url: str, dest, progress=None, headers: dict | None = None):
+    """
+    Downloads url into dest, a Path or an open binary file (e.g. io.BytesIO).
+    Returns the response headers, or None when a conditional request was
+    answered with 304 (dest is left untouched).
+    """
+    name = dest.name if isinstance(dest, Path) else url.rsplit("/", 1)[-1]
     try:
-        request = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-        with urllib.request.urlopen(request) as response, dest.open("wb") as handle:
-            handle.write(response.read())
+        response = open_url(url, headers)
+        if response is None:
+            print(f"{name} is up to date.")
+            return None
+        print(f"Downloading {url} -> {name} ...")
+        with response:
+            if isinstance(dest, Path):
+                with dest.open("wb", buffering=DOWNLOAD_CHUNK_SIZE) as handle:
+                    copy_response(response, handle, progress)
+            else:
+                copy_response(response, dest, progress)
+        return response.headers
     except Exception as e:
         print(f"ERROR downloading {url}: {e}")
         raise
@@ -106,144 +244,204 @@ def download_file(url: str, dest: Path):
 def png_to_ico(png_data: bytes) -> bytes:
     if not png_data.startswith(b"\x89PNG"):
         raise ValueError("Icon data is not a PNG")
-    width = int.from_bytes(png_data[16:20], "big")
-    height = int.from_bytes(png_data[20:24], "big")
+    # IHDR width and height, big-endian, right after the signature and chunk header
+    width, height = struct.unpack_from(">II", png_data, 16)
     w = width if width < 256 else 0
     h = height if height < 256 else 0
     header = struct.pack("<HHH", 0, 1, 1)
     entry = struct.pack("<BBBBHHII", w, h, 0, 0, 1, 32, len(png_data), 22)
-    return header + entry + png_data
+    return b"".join((header, entry, png_data))
 
-def ensure_icon_files():
+def ensure_icon_files(download: bool = True):
     png_path = ICON_CACHE_DIR / "app.png"
     ico_path = ICON_CACHE_DIR / "app.ico"
-    if png_path.exists() and ico_path.exists():
-        return png_path, ico_path
     try:
-        download_file(ICON_URL, png_path)
-        ico_path.write_bytes(png_to_ico(png_path.read_bytes()))
+        png_stat = stat_or_none(png_path)
+        if png_stat is None:
+            if not download:
+                return None, None
+            # encode straight from the downloaded bytes, no write-then-read of the PNG
+            png_data = download_bytes(ICON_URL)
+            ico_data = png_to_ico(png_data)
+            ICON_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            png_path.write_bytes(png_data)
+            ico_path.write_bytes(ico_data)
+            return png_path, ico_path
+        # re-encode only when the cached ICO is missing or older than the PNG
+        ico_stat = stat_or_none(ico_path)
+        if ico_stat is None or ico_stat.st_mtime < png_stat.st_mtime:
+            ico_path.write_bytes(png_to_ico(png_path.read_bytes()))
     except Exception:
         return None, None
     return png_path, ico_path
 
-def get_remote_last_modified(url: str):
-    try:
-        request = urllib.request.Request(url, method="HEAD")
-        with urllib.request.urlopen(request) as response:
-            return response.headers.get("Last-Modified")
-    except Exception:
-        return None
-
 def read_version_stamp():
-    if FFMPEG_VERSION_FILE.exists():
+    try:
         return FFMPEG_VERSION_FILE.read_text(encoding="utf-8").strip()
-    return None
+    except FileNotFoundError:
+        return None
 
 def write_version_stamp(value: str | None):
     if value:
         FFMPEG_VERSION_FILE.write_text(value, encoding="utf-8")
 
-def ensure_yt_dlp():
-    if not YT_DLP_EXE.exists():
-        tmp = BIN / "yt-dlp.tmp.exe"
-        download_file(YTDLP_RELEASE_URL, tmp)
-        tmp.replace(YT_DLP_EXE)
-        print("yt-dlp downloaded.")
-    else:
-        # try to self-update via downloaded binary; ignore errors
-        try:
-            subprocess.run(
-                [str(YT_DLP_EXE), "-U"],
-                check=False,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform.startswith("win") else 0,
-            )
-        except Exception:
-            pass
+def conditional_headers(local_stamp: str | None):
+    return {"If-Modified-Since": local_stamp} if local_stamp else None
 
-def ensure_ffmpeg():
-    remote_stamp = get_remote_last_modified(FFMPEG_ZIP_URL)
-    local_stamp = read_version_stamp()
-    needs_update = not FFMPEG_EXE.exists()
-    if remote_stamp and remote_stamp != local_stamp:
-        needs_update = True
+def checked_recently(stamp: Path) -> bool:
+    try:
+        return time.time() - stamp.stat().st_mtime < UPDATE_CHECK_INTERVAL
+    except OSError:
+        return False
+
+def file_sha256(path: Path) -> str:
+    with path.open("rb") as handle:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: handle.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+def fetch_yt_dlp_checksum():
+    """Returns the published SHA-256 of the latest yt-dlp.exe, or None if it is not listed."""
+    sums = download_bytes(YTDLP_SUMS_URL).decode("utf-8", "replace")
+    for line in sums.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[1].lstrip("*") == YT_DLP_EXE.name:
+            return parts[0].lower()
+    return None
 
-    if needs_update:
-        zpath = BIN / "ffmpeg.zip"
-        download_file(FFMPEG_ZIP_URL, zpath)
+def install_yt_dlp(expected: str | None, progress=None):
+    tmp = BIN / "yt-dlp.tmp.exe"
+    download_file(YTDLP_RELEASE_URL, tmp, progress)
+    if expected and file_sha256(tmp) != expected:
+        tmp.unlink(missing_ok=True)
+        raise ValueError("downloaded yt-dlp.exe does not match the published checksum")
+    tmp.replace(YT_DLP_EXE)
+    print("yt-dlp downloaded.")
+
+def ensure_yt_dlp(progress=None):
+    # serialized: the GUI starts a background check at launch and run_downloads waits for it
+    with YT_DLP_LOCK:
+        installed = YT_DLP_EXE.exists()
+        if installed and checked_recently(YT_DLP_CHECK_STAMP):
+            return
+        # the release's SHA2-256SUMS is a few KB; hashing the local binary tells
+        # whether the latest release differs without downloading or running it
         try:
-            with zipfile.ZipFile(zpath, "r") as z:
-                z.extractall(BIN)
-            # find ffmpeg/ffprobe in extracted tree
-            ffmpeg_src = None
-            ffprobe_src = None
-            for p in BIN.rglob("ffmpeg.exe"):
-                ffmpeg_src = p
-                break
-            for p in BIN.rglob("ffprobe.exe"):
-                ffprobe_src = p
-                break
-            if not ffmpeg_src:
-                raise FileNotFoundError("ffmpeg.exe not found inside archive")
-            shutil.copy2(ffmpeg_src, FFMPEG_EXE)
-            if ffprobe_src:
-                shutil.copy2(ffprobe_src, BIN / "ffprobe.exe")
-            write_version_stamp(remote_stamp)
-            print("ffmpeg extracted.")
-        finally:
+            expected = fetch_yt_dlp_checksum()
+        except Exception as e:
+            print(f"Could not fetch yt-dlp checksums: {e}")
+            expected = None
+        if not installed:
+            install_yt_dlp(expected, progress)
+        elif expected is None:
+            # fall back to the binary's own self-update; ignore errors
             try:
-                zpath.unlink()
+                subprocess.run(
+                    [str(YT_DLP_EXE), "-U"],
+                    check=False,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    creationflags=CREATION_FLAGS,
+                )
             except Exception:
                 pass
+        elif file_sha256(YT_DLP_EXE) != expected:
+            try:
+                install_yt_dlp(expected, progress)
+            except Exception as e:
+                # keep the installed binary; try again on the next run
+                print(f"yt-dlp update failed: {e}")
+                return
+        YT_DLP_CHECK_STAMP.touch()
+
+def ensure_ffmpeg(progress=None):
+    # serialized like ensure_yt_dlp: the GUI warm-up may still be fetching
+    with FFMPEG_LOCK:
+        _ensure_ffmpeg(progress)
+
+def _ensure_ffmpeg(progress=None):
+    installed = FFMPEG_EXE.exists()
+    if installed and checked_recently(FFMPEG_CHECK_STAMP):
+        return
+    local_stamp = read_version_stamp() if installed else None
+    # the zip is kept in memory; only ffmpeg.exe/ffprobe.exe are written to disk
+    zbuf = io.BytesIO()
+    try:
+        # one conditional GET: 304 when the release zip has not changed
+        headers = download_file(FFMPEG_ZIP_URL, zbuf, progress, conditional_headers(local_stamp))
+    except Exception:
+        if not installed:
+            raise
+        # keep the local copy when the update check fails
+        return
+
+    if headers is not None:
+        with zipfile.ZipFile(zbuf, "r") as z:
+            # match on the base name; some archivers store backslash separators
+            members = {
+                info.filename.replace("\\", "/").rsplit("/", 1)[-1]: info
+                for info in z.infolist()
+                if info.filename.endswith(".exe")
+            }
+            if "ffmpeg.exe" not in members:
+                raise FileNotFoundError("ffmpeg.exe not found inside archive")
+            for exe_name in ("ffmpeg.exe", "ffprobe.exe"):
+                if exe_name in members:
+                    # members are deflated, so they have to pass through Python once;
+                    # write next to the target and rename it into place (no second copy)
+                    tmp = BIN / f"{exe_name}.tmp"
+                    with z.open(members[exe_name]) as src, tmp.open("wb") as dst:
+                        shutil.copyfileobj(src, dst, DOWNLOAD_CHUNK_SIZE)
+                    os.replace(tmp, BIN / exe_name)
+        write_version_stamp(headers.get("Last-Modified"))
+        print("ffmpeg extracted.")
+    FFMPEG_CHECK_STAMP.touch()
 
 def read_urls_from_file():
-    if not URLS_FILE.exists():
+    try:
+        text = URLS_FILE.read_text(encoding="utf-8")
+    except FileNotFoundError:
         print("No urls.txt found. Create the file and put one URL per line.")
         sys.exit(1)
-    lines = []
-    with URLS_FILE.open(encoding="utf-8") as f:
-        for l in f:
-            l = l.strip()
-            if not l or l.startswith("#"):
-                continue
-            lines.append(l)
+    lines = read_urls_from_text(text)
     if not lines:
         print("urls.txt is empty (or only comments).")
         sys.exit(1)
     return lines
 
 def read_urls_from_text(text: str):
-    lines = []
-    for l in text.splitlines():
-        l = l.strip()
-        if not l or l.startswith("#"):
-            continue
-        lines.append(l)
-    return lines
-
-def build_command(url: str, output_dir: Path, output_format: dict, playlist_mode: str):
+    # skip blank lines and "#" comments; a repeated URL would only spawn another yt-dlp run
+    urls = [l for raw in text.splitlines() if (l := raw.strip()) and l[0] != "#"]
+    return list(dict.fromkeys(urls))
+
+# arguments shared by every yt-dlp run, built once at import
+YT_DLP_BASE_ARGS = (
+    str(YT_DLP_EXE),
+    "--encoding",
+    OUTPUT_ENCODING,
+    "--js-runtimes",
+    "node",
+    "-N",
+    PARALLEL_FRAGMENTS,
+    "--concurrent-fragments",
+    CONCURRENT_FRAGMENTS,
+    "--ffmpeg-location",
+    str(BIN),
+    "--add-metadata",
+    "--embed-metadata",
+    "--progress",
+    "--newline",
+    "--ignore-errors",
+    "--no-mtime",
+    "--restrict-filenames",
+)
+
+def build_command(urls: list, output_dir: Path, output_format: dict, playlist_mode: str):
     outtmpl = f"{output_dir / '%(title)s.%(ext)s'}"
-    cmd = [
-        str(YT_DLP_EXE),
-        "--js-runtimes",
-        "node",
-        "-o",
-        outtmpl,
-        "-N",
-        PARALLEL_FRAGMENTS,
-        "--concurrent-fragments",
-        CONCURRENT_FRAGMENTS,
-        "--ffmpeg-location",
-        str(BIN),
-        "--add-metadata",
-        "--embed-metadata",
-        "--progress",
-        "--newline",
-        "--ignore-errors",
-        "--no-mtime",
-        "--restrict-filenames",
-    ]
+    cmd = [*YT_DLP_BASE_ARGS, "-o", outtmpl]
     if output_format["video_only"]:
         cmd += ["-f", "bestvideo[ext=webm]+bestaudio[ext=webm]/best[ext=webm]"]
         cmd += ["--no-embed-thumbnail"]
@@ -262,33 +460,146 @@ def build_command(url: str, output_dir: Path, output_format: dict, playlist_mode
             cmd += ["--audio-quality", AUDIO_QUALITY]
         if output_format.get("audio_codec"):
             cmd += ["--postprocessor-args", f"ffmpeg:-c:a {output_format['audio_codec']}"]
-    cmd.append(url)
     if playlist_mode == "single":
-        cmd.insert(-1, "--no-playlist")
+        cmd.append("--no-playlist")
+    cmd += urls
     return cmd
 
-def infer_status(line: str):
+def infer_status(line: bytes):
     lowered = line.lower()
-    if "extracting audio" in lowered or "post-process" in lowered or "ffmpeg" in lowered:
+    if b"extracting audio" in lowered or b"post-process" in lowered or b"ffmpeg" in lowered:
         return "converting"
-    if "adding metadata" in lowered or "embedding" in lowered:
+    if b"adding metadata" in lowered or b"embedding" in lowered:
         return "tagging"
-    if "deleting original" in lowered:
+    if b"deleting original" in lowered:
         return "cleanup"
-    if "warning" in lowered:
+    if b"warning" in lowered:
         return "warning"
-    if "error" in lowered:
+    if b"error" in lowered:
         return "error"
-    if "[download]" in lowered or "%" in lowered or "destination" in lowered:
+    if b"[download]" in lowered or b"%" in lowered or b"destination" in lowered:
         return "downloading"
     return None
 
-def log_line(message: str, log_handle):
-    with LOG_LOCK:
-        log_handle.write(message + "\n")
-        log_handle.flush()
+def _write_log_file(handles: dict, path: Path, chunks: list):
+    handle = handles.get(path)
+    if handle is None:
+        handle = handles[path] = path.open("ab", buffering=1 << 16)
+    handle.write(b"".join(chunks))
+    handle.flush()
+
+def _drop_log_file(handles: dict, path: Path):
+    # close a failed handle now rather than leaving its buffer to the garbage collector
+    handle = handles.pop(path, None)
+    if handle is not None:
+        try:
+            handle.close()
+        except Exception:
+            pass
+
+def _log_writer(log_queue: Queue):
+    # each log file is opened once and kept open for the life of the process
+    handles = {}
+    while True:
+        batch = [log_queue.get()]
+        while len(batch) < 256:
+            try:
+                batch.append(log_queue.get_nowait())
+            except Empty:
+                break
+        try:
+            # grouped per file (keeping order) so one failing file does not cost the other its lines
+            per_path = {}
+            for path, data in batch:
+                per_path.setdefault(path, []).append(data)
+            failures = []
+            for path, chunks in per_path.items():
+                try:
+                    _write_log_file(handles, path, chunks)
+                except Exception as e:
+                    # drop this file's lines and reopen it next time; the thread must stay alive
+                    _drop_log_file(handles, path)
+                    failures.append((path, e))
+            for path, e in failures:
+                message = f"Failed to write log {path}: {e}"
+                if sys.stderr is not None:
+                    print(message, file=sys.stderr)
+                if path != ERR_LOG_FILE:
+                    try:
+                        _write_log_file(handles, ERR_LOG_FILE, [(message + "\n").encode("utf-8")])
+                    except Exception:
+                        _drop_log_file(handles, ERR_LOG_FILE)
+        finally:
+            # always account for the batch so flush_log() can never hang
+            for _ in batch:
+                log_queue.task_done()
+
+def start_log_writer():
+    global LOG_WRITER
+    if LOG_WRITER is None:
+        LOG_WRITER = threading.Thread(target=_log_writer, args=(LOG_QUEUE,), daemon=True)
+        LOG_WRITER.start()
+
+def flush_log():
+    """Blocks until every queued line has been written to its log file."""
+    if LOG_WRITER is not None:
+        LOG_QUEUE.join()
+
+def log_line(message: str):
+    LOG_QUEUE.put((LOG_FILE, (message + "\n").encode("utf-8")))
+
+def log_bytes(data: bytes):
+    """Queues already-encoded yt-dlp output for the log as-is."""
+    LOG_QUEUE.put((LOG_FILE, data))
 
-def queue_event(event_queue: Queue | None, payload: dict):
+def log_error(message: str):
+    LOG_QUEUE.put((ERR_LOG_FILE, (message + "\n").encode("utf-8")))
+
+def write_console(data: bytes):
+    """
+    Writes a batch of yt-dlp output to the console with a single os.write,
+    holding CONSOLE_LOCK only around the syscall instead of going through print().
+    The bytes are passed through untouched unless the console uses another encoding.
+    """
+    stdout = sys.stdout
+    if stdout is None:  # windowed (no console) builds
+        return
+    try:
+        fd = stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        # not backed by a file descriptor (e.g. an IDE console)
+        stdout.write(data.decode(OUTPUT_ENCODING, "replace"))
+        stdout.flush()
+        return
+    # the console's own encoding: os.write bypasses sys.stdout's text layer
+    encoding = os.device_encoding(fd) or stdout.encoding or OUTPUT_ENCODING
+    if codecs.lookup(encoding).name != codecs.lookup(OUTPUT_ENCODING).name:
+        data = data.decode(OUTPUT_ENCODING, "replace").encode(encoding, "replace")
+    view = memoryview(data)
+    stdout.flush()  # keep earlier print() output ahead of this batch
+    with CONSOLE_LOCK:
+        while view:
+            view = view[os.write(fd, view):]
+
+def read_output_batches(stream):
+    """
+    Yields lists of raw output lines (bytes), one list per read from the pipe:
+    whatever yt-dlp has written so far (up to PIPE_BUFFER_SIZE bytes) becomes
+    one batch, so bursts are handled together and a lone line is not held back.
+    """
+    pending = b""
+    while True:
+        chunk = stream.read1(PIPE_BUFFER_SIZE)
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        if not chunk and pending:
+            lines.append(pending)
+        if lines:
+            yield [line.rstrip(b"\r") for line in lines]
+        if not chunk:
+            return
+
+def queue_event(event_queue: EventBuffer | None, payload: dict):
     if event_queue is not None:
         event_queue.put(payload)
 
@@ -298,91 +609,154 @@ def run_yt_dlp_for_url(
     output_dir: Path,
     output_format: dict,
     playlist_mode: str,
-    event_queue: Queue | None = None,
+    event_queue: EventBuffer | None = None,
+    quiet_console: bool = False,
 ):
     """
     Runs yt-dlp.exe as a subprocess for a single URL.
-    Streams stdout/stderr to console/GUI with prefix and appends to log files.
     Returns (url, returncode).
     """
-    cmd = build_command(url, output_dir, output_format, playlist_mode)
-    prefix = f"[{index}] "
-
-    creationflags = subprocess.CREATE_NO_WINDOW if sys.platform.startswith("win") else 0
-    proc = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        bufsize=1,
-        universal_newlines=True,
-        creationflags=creationflags,
+    _, retcode = run_yt_dlp_for_urls(
+        [url], index, output_dir, output_format, playlist_mode, event_queue, quiet_console
     )
+    return (url, retcode)
+
+def run_yt_dlp_for_urls(
+    urls: list,
+    index: int,
+    output_dir: Path,
+    output_format: dict,
+    playlist_mode: str,
+    event_queue: EventBuffer | None = None,
+    quiet_console: bool = False,
+):
+    """
+    Runs one yt-dlp.exe subprocess for all given URLs (downloaded one after another).
+    Streams stdout/stderr to console/GUI with prefix and appends to log files.
+    With quiet_console, yt-dlp writes into a logs/yt-dlp.<index>.*.log file instead, which is
+    appended to the log file together with the START/END banners once it exits.
+    Returns (urls, returncode); the code is non-zero if any URL failed.
+    """
+    cmd = build_command(urls, output_dir, output_format, playlist_mode)
+    url = " ".join(urls)
+    prefix = f"[{index}] ".encode()
+
+    proc = None
     retcode = None
     try:
-        with LOG_FILE.open("a", encoding="utf-8") as logf:
-            log_line(f"\n\n=== START {time.strftime('%Y-%m-%d %H:%M:%S')} URL={url}", logf)
-            for line in proc.stdout:
-                out_line = line.rstrip("\n")
-                console_line = prefix + out_line
-                print(console_line)
-                log_line(console_line, logf)
-                queue_event(event_queue, {"type": "log", "text": console_line})
-                status = infer_status(out_line)
-                if status:
-                    queue_event(event_queue, {"type": "status", "index": index, "status": status})
+        start_banner = f"\n\n=== START {time.strftime('%Y-%m-%d %H:%M:%S')} URL={url}"
+        if quiet_console:
+            # yt-dlp writes into a file of its own (no pipe through Python); sharing
+            # LOG_FILE between processes could interleave or overwrite on Windows.
+            # Unique per run, so concurrent launchers don't truncate each other and a
+            # killed run's output is left behind in logs/ instead of being overwritten.
+            fd, process_log = tempfile.mkstemp(dir=LOG_FILE.parent, prefix=f"yt-dlp.{index}.", suffix=".log")
+            process_log = Path(process_log)
+            with open(fd, "wb") as logf:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=logf,
+                    stderr=subprocess.STDOUT,
+                    creationflags=CREATION_FLAGS,
+                )
+                proc.wait()
+            retcode = proc.returncode
+            # START, output and END as a single log entry, so parallel processes
+            # (whose output is not prefixed here) cannot interleave in the log
+            log_bytes(b"".join((
+                f"{start_banner}\n".encode("utf-8"),
+                process_log.read_bytes(),
+                f"=== END returncode={retcode}\n".encode("utf-8"),
+            )))
+            process_log.unlink()
+        else:
+            log_line(start_banner)
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=PIPE_BUFFER_SIZE,
+                creationflags=CREATION_FLAGS,
+            )
+            last_status = None
+            for out_lines in read_output_batches(proc.stdout):
+                console_lines = [prefix + out_line for out_line in out_lines]
+                # one console write and one log entry per batch instead of per line;
+                # the bytes are only decoded for the GUI
+                data = b"\n".join(console_lines) + b"\n"
+                write_console(data)
+                log_bytes(data)
+                for out_line, console_line in zip(out_lines, console_lines):
+                    if event_queue is not None:
+                        text = console_line.decode(OUTPUT_ENCODING, "replace")
+                        event_queue.put({"type": "log", "text": text})
+                    status = infer_status(out_line)
+                    # progress ticks repeat "downloading"; only report transitions
+                    if status and status != last_status:
+                        last_status = status
+                        queue_event(event_queue, {"type": "status", "index": index, "status": status})
             proc.wait()
             retcode = proc.returncode
-            log_line(f"=== END returncode={retcode}", logf)
+            log_line(f"=== END returncode={retcode}")
     except Exception as e:
-        with ERR_LOG_FILE.open("a", encoding="utf-8") as ef:
-            ef.write(f"ERROR for {url}: {e}\n")
+        log_error(f"ERROR for {url}: {e}")
         if proc and proc.poll() is None:
             proc.kill()
         retcode = -1
 
-    return (url, retcode)
+    return (urls, retcode)
 
 def cli_main():
     print("=== yt-dlp Python downloader ===")
     ensure_dirs()
     print("Ensuring yt-dlp and ffmpeg binaries...")
+    # independent downloads: fetch both concurrently
+    with ThreadPoolExecutor(max_workers=2) as exe:
+        yt_dlp_future = exe.submit(ensure_yt_dlp, download_progress("yt-dlp"))
+        ffmpeg_future = exe.submit(ensure_ffmpeg, download_progress("ffmpeg"))
     try:
-        ensure_yt_dlp()
+        yt_dlp_future.result()
     except Exception as e:
         print("Failed to ensure yt-dlp:", e)
         sys.exit(1)
     try:
-        ensure_ffmpeg()
+        ffmpeg_future.result()
     except Exception as e:
         print("Failed to ensure ffmpeg:", e)
         print("Warning: ffmpeg missing or failed to extract. Conversion may fail.")
 
     urls = read_urls_from_file()
     playlist_mode = "playlist" if "--playlist" in sys.argv else "single" if "--single" in sys.argv else "playlist"
+    quiet_console = "--quiet-console" in sys.argv
     output_format = OUTPUT_FORMATS[0]
-    print(f"Loaded {len(urls)} URLs. Starting up to {MAX_WORKERS} parallel downloads.")
+    # one yt-dlp process per worker, each taking every MAX_WORKERS-th URL: the
+    # interpreter startup, extractor setup and connections are paid once per process
+    chunks = [urls[i::MAX_WORKERS] for i in range(min(MAX_WORKERS, len(urls)))]
+    print(f"Loaded {len(urls)} URLs. Starting {len(chunks)} parallel yt-dlp processes.")
     start_time = time.time()
     results = []
 
     with ThreadPoolExecutor(max_workers=MAX_WORKERS) as exe:
-        futures = {
-            exe.submit(run_yt_dlp_for_url, url, i + 1, OUT, output_format, playlist_mode): url
-            for i, url in enumerate(urls)
-        }
+        futures = [
+            exe.submit(run_yt_dlp_for_urls, chunk, i + 1, OUT, output_format, playlist_mode, None, quiet_console)
+            for i, chunk in enumerate(chunks)
+        ]
         for fut in as_completed(futures):
-            url = futures[fut]
+            # at most MAX_WORKERS futures, so the linear lookup is cheaper than a dict
+            index = futures.index(fut) + 1
+            chunk = chunks[index - 1]
             try:
                 res = fut.result()
                 results.append(res)
                 if res[1] == 0:
-                    print(f"[SUMMARY] {url} -> OK")
+                    print(f"[SUMMARY] [{index}] OK: {', '.join(chunk)}")
                 else:
-                    print(f"[SUMMARY] {url} -> FAILED (code {res[1]})")
+                    print(f"[SUMMARY] [{index}] FAILED (code {res[1]}), at least one of: {', '.join(chunk)}")
             except Exception as e:
-                print(f"[ERROR] {url} raised exception: {e}")
-                with ERR_LOG_FILE.open("a", encoding="utf-8") as ef:
-                    ef.write(f"Exception for {url}: {e}\n")
+                print(f"[ERROR] [{index}] raised exception: {e}")
+                log_error(f"Exception for {' '.join(chunk)}: {e}")
 
+    flush_log()
     elapsed = time.time() - start_time
     print("All done. Elapsed: {:.1f}s".format(elapsed))
     print("Logs:", LOG_FILE)
@@ -395,7 +769,7 @@ class DownloaderGUI:
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title(f"YouTube Audio Downloader - {PUBLISHER}")
-        self.event_queue = Queue()
+        self.event_queue = EventBuffer(notify=self.notify_events)
         self.executor = None
         self.worker_thread = None
 
@@ -404,6 +778,7 @@ class DownloaderGUI:
         self.log_window = None
         self.log_buffer = []
         self.status_tree = None
+        self._last_status = {}
 
         self.output_dir_var = tk.StringVar(value=str(OUT))
         self.format_var = tk.StringVar(value=OUTPUT_FORMATS[0]["name"])
@@ -412,9 +787,32 @@ class DownloaderGUI:
         self.start_button = None
 
         self.configure_theme()
-        self.set_app_icon()
+        # cached or embedded icon now; a missing avatar is fetched by warm_up
+        png_path, ico_path = ensure_icon_files(download=False)
+        self.set_app_icon(png_path, ico_path)
         self.build_ui()
-        self.process_queue()
+        self.root.bind("<<DrainEvents>>", lambda event: self.process_queue())
+        # pick up anything queued before mainloop() started, when no wake-up could be delivered
+        self.root.after_idle(self.process_queue)
+        threading.Thread(target=self.warm_up, args=(png_path is None,), daemon=True).start()
+
+    def warm_up(self, fetch_icon: bool):
+        """
+        Runs the launch-time network work off the GUI thread, all three fetches
+        overlapping: the avatar icon, the yt-dlp update check and the ffmpeg check.
+        Failures are ignored here; run_downloads retries and reports them.
+        """
+        BIN.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=3) as exe:
+            if fetch_icon:
+                exe.submit(self.fetch_icon)
+            exe.submit(ensure_yt_dlp, download_progress("yt-dlp", self.event_queue))
+            exe.submit(ensure_ffmpeg, download_progress("ffmpeg", self.event_queue))
+
+    def fetch_icon(self):
+        png_path, ico_path = ensure_icon_files()
+        if png_path:
+            queue_event(self.event_queue, {"type": "icon", "png": png_path, "ico": ico_path})
 
     def configure_theme(self):
         self.root.configure(bg="#1e1e1e")
@@ -435,24 +833,26 @@ class DownloaderGUI:
         style.configure("Treeview", background="#2b2b2b", foreground="#e0e0e0", fieldbackground="#2b2b2b")
         style.configure("Treeview.Heading", background="#1e1e1e", foreground="#e0e0e0")
 
-    def set_app_icon(self):
+    def set_app_icon(self, png_path: Path | None, ico_path: Path | None):
         icon_loaded = False
-        png_path, ico_path = ensure_icon_files()
         if sys.platform.startswith("win"):
             try:
-                if ico_path and ico_path.exists():
+                if ico_path:
                     self.root.iconbitmap(default=str(ico_path))
                     icon_loaded = True
                 else:
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=".ico") as tmp:
-                        tmp.write(base64.b64decode(ICO_BASE64))
-                        self._icon_temp_path = tmp.name
+                    # write the embedded icon once and keep it in the cache
+                    embedded_ico = ICON_CACHE_DIR / "embedded.ico"
+                    if stat_or_none(embedded_ico) is None:
+                        ICON_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                        embedded_ico.write_bytes(ICO_BYTES)
+                    self._icon_temp_path = str(embedded_ico)
                     self.root.iconbitmap(default=self._icon_temp_path)
                     icon_loaded = True
             except Exception:
                 pass
         try:
-            if png_path and png_path.exists():
+            if png_path:
                 icon_image = tk.PhotoImage(file=str(png_path))
             else:
                 icon_image = tk.PhotoImage(data=PNG_BASE64)
@@ -655,8 +1055,8 @@ class DownloaderGUI:
         log_text.pack(fill="both", padx=12, pady=12, expand=True)
         self.log_text = log_text
         self.log_text.configure(state=tk.NORMAL)
-        for line in self.log_buffer:
-            self.log_text.insert(tk.END, line + "\n")
+        if self.log_buffer:
+            self.log_text.insert(tk.END, "\n".join(self.log_buffer) + "\n")
         self.log_text.see(tk.END)
         self.log_text.configure(state=tk.DISABLED)
 
@@ -677,6 +1077,7 @@ class DownloaderGUI:
             return
 
         self.status_tree.delete(*self.status_tree.get_children())
+        self._last_status = {}
         for i, url in enumerate(urls, start=1):
             self.status_tree.insert("", "end", iid=str(i), values=("queued", url))
 
@@ -692,14 +1093,18 @@ class DownloaderGUI:
 
     def run_downloads(self, urls, output_dir: Path, output_format: dict, playlist_mode: str):
         ensure_dirs()
+        # independent downloads: fetch both concurrently
+        with ThreadPoolExecutor(max_workers=2) as exe:
+            yt_dlp_future = exe.submit(ensure_yt_dlp, download_progress("yt-dlp", self.event_queue))
+            ffmpeg_future = exe.submit(ensure_ffmpeg, download_progress("ffmpeg", self.event_queue))
         try:
-            ensure_yt_dlp()
+            yt_dlp_future.result()
         except Exception as e:
             queue_event(self.event_queue, {"type": "log", "text": f"Failed to ensure yt-dlp: {e}"})
             queue_event(self.event_queue, {"type": "done"})
             return
         try:
-            ensure_ffmpeg()
+            ffmpeg_future.result()
         except Exception as e:
             queue_event(self.event_queue, {"type": "log", "text": f"Failed to ensure ffmpeg: {e}"})
             queue_event(self.event_queue, {"type": "log", "text": "Warning: ffmpeg missing or failed to extract. Conversion may fail."})
@@ -707,59 +1112,69 @@ class DownloaderGUI:
         output_dir.mkdir(parents=True, exist_ok=True)
         start_time = time.time()
 
+        # each worker reports its own final status; leaving the block waits for all of them
         with ThreadPoolExecutor(max_workers=MAX_WORKERS) as exe:
-            futures = {
-                exe.submit(
-                    run_yt_dlp_for_url,
-                    url,
-                    i + 1,
-                    output_dir,
-                    output_format,
-                    playlist_mode,
-                    self.event_queue,
-                ): (url, i + 1)
-                for i, url in enumerate(urls)
-            }
-            for fut in as_completed(futures):
-                url, index = futures[fut]
-                try:
-                    _, code = fut.result()
-                    status = "done" if code == 0 else f"failed ({code})"
-                    queue_event(self.event_queue, {"type": "status", "index": index, "status": status})
-                except Exception as e:
-                    queue_event(self.event_queue, {"type": "log", "text": f"[ERROR] {url} raised exception: {e}"})
-                    queue_event(self.event_queue, {"type": "status", "index": index, "status": "error"})
+            for i, url in enumerate(urls):
+                exe.submit(self.download_url, url, i + 1, output_dir, output_format, playlist_mode)
 
+        flush_log()
         elapsed = time.time() - start_time
         queue_event(self.event_queue, {"type": "log", "text": f"All done. Elapsed: {elapsed:.1f}s"})
         queue_event(self.event_queue, {"type": "done"})
 
+    def download_url(self, url: str, index: int, output_dir: Path, output_format: dict, playlist_mode: str):
+        try:
+            _, code = run_yt_dlp_for_url(url, index, output_dir, output_format, playlist_mode, self.event_queue)
+            status = "done" if code == 0 else f"failed ({code})"
+        except Exception as e:
+            queue_event(self.event_queue, {"type": "log", "text": f"[ERROR] {url} raised exception: {e}"})
+            status = "error"
+        queue_event(self.event_queue, {"type": "status", "index": index, "status": status})
+
     def append_log(self, text: str):
-        self.log_buffer.append(text)
+        self.append_logs([text])
+
+    def append_logs(self, lines: list):
+        self.log_buffer.extend(lines)
         if not self.log_text:
             return
+        # one Tk insert for the whole batch
         self.log_text.configure(state=tk.NORMAL)
-        self.log_text.insert(tk.END, text + "\n")
+        self.log_text.insert(tk.END, "\n".join(lines) + "\n")
         self.log_text.see(tk.END)
         self.log_text.configure(state=tk.DISABLED)
 
+    def notify_events(self) -> bool:
+        # called from worker threads; Tk delivers the virtual event on the GUI thread
+        try:
+            self.root.event_generate("<<DrainEvents>>", when="tail")
+            return True
+        except (tk.TclError, RuntimeError):
+            # e.g. the main loop is not running yet; EventBuffer retries on the next put
+            return False
+
     def process_queue(self):
-        while True:
-            try:
-                event = self.event_queue.get_nowait()
-            except Empty:
-                break
+        log_lines = []
+        statuses = {}
+        for event in self.event_queue.drain():
             if event.get("type") == "log":
-                self.append_log(event.get("text", ""))
+                log_lines.append(event.get("text", ""))
             elif event.get("type") == "status":
-                index = str(event.get("index"))
-                status = event.get("status")
-                if self.status_tree.exists(index):
-                    current = self.status_tree.item(index, "values")
-                    self.status_tree.item(index, values=(status, current[1]))
+                # only the latest status per row in this batch matters
+                statuses[str(event.get("index"))] = event.get("status")
             elif event.get("type") == "done":
                 self.set_controls_state(True)
-        self.root.after(200, self.process_queue)
+            elif event.get("type") == "icon":
+                self.set_app_icon(event["png"], event["ico"])
+        if log_lines:
+            self.append_logs(log_lines)
+        for index, status in statuses.items():
+            if self._last_status.get(index) == status:
+                continue
+            self._last_status[index] = status
+            if self.status_tree.exists(index):
+                current = self.status_tree.item(index, "values")
+                self.status_tree.item(index, values=(status, current[1]))
 
 
 def main():
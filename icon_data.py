@@ -1,3 +1,9 @@
 # Generated icon data (base64). Do not edit manually.
+import base64
+
 PNG_BASE64 = "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAAlUlEQVR42u3asQ3AMAgEQIZg/3myVTJCmhheyhXU1l9h2UB19/3nKgAAAAAAAAAAAAAAAAAAAADA9wdcdbxiASbCA0gFmAoPIBFgMjyANIDp8ACSADbCA0gB2AoPIAFgMzyAbYDt8AAAuAMAeAcA8BcAoB8AQE8QgLkAALNBAPYDbIgAAAAAAAAAAAAAAAAAAAAAb/UASea+yF5fIjwAAAAASUVORK5CYII="
 ICO_BASE64 = "AAABAAEAQEAAAAEAIADOAAAAFgAAAIlQTkcNChoKAAAADUlIRFIAAABAAAAAQAgGAAAAqmlx3gAAAJVJREFUeNrt2rENwDAIBECGYP95slUyQpoYXsoV1NZfYdlAdff95yoAAAAAAAAAAAAAAAAAAAAAwPcHXHW8YgEmwgNIBZgKDyARYDI8gDSA6fAAkgA2wgNIAdgKDyABYDM8gG2A7fAAALgDAHgHAPAXAKAfAEBPEIC5AACzQQD2A2yIAAAAAAAAAAAAAAAAAAAAAG/1AEnmvsheXyI8AAAAAElFTkSuQmCC"
+
+# decoded once at import
+PNG_BYTES = base64.b64decode(PNG_BASE64)
+ICO_BYTES = base64.b64decode(ICO_BASE64)